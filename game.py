@@ -10,7 +10,9 @@ Controls:
   R                 - Restart after game over
   ESC               - Quit
 
+Requires:     Python 3.10+
 Dependencies: pip install pygame
+Optional:     pip install numba   (JIT-compiles the A* / flood-fill kernels)
 """
 
 import pygame
@@ -18,9 +20,22 @@ import sys
 import heapq
 import random
 import math
+from array import array
+from string import Template
+from collections import deque
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Dict
 
+try:
+    import numpy as np
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    # Numba is optional – without it the pure-Python search below is used
+    HAVE_NUMBA = False
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
 # ─────────────────────────────────────────────
 # CONSTANTS
 # ─────────────────────────────────────────────
@@ -29,7 +44,9 @@ COLS       = 60
 ROWS       = 40
 WIDTH      = COLS * CELL
 HEIGHT     = ROWS * CELL
-FPS        = 15
+FPS        = 15           # simulation ticks per second
+RENDER_FPS = 60           # display frames per second
+TICK_MS    = 1000 / FPS
 
 # Tron neon colour palette
 BG_COLOR        = (2,   4,  16)
@@ -50,9 +67,27 @@ LEFT  = (-1,  0)
 RIGHT = ( 1,  0)
 DIRS  = [UP, DOWN, LEFT, RIGHT]
 
+# Player steering keys (arrows + WASD)
+KEY_DIRS = {
+    pygame.K_UP:    UP,    pygame.K_w: UP,
+    pygame.K_DOWN:  DOWN,  pygame.K_s: DOWN,
+    pygame.K_LEFT:  LEFT,  pygame.K_a: LEFT,
+    pygame.K_RIGHT: RIGHT, pygame.K_d: RIGHT,
+}
+
+INF   = float("inf")
+
 def opposite(d):
     return (-d[0], -d[1])
 
+# Cells are packed to a single int, y*COLS + x, wherever they are hashed
+# or used as an index into a COLS*ROWS grid.
+def pack(pos: Tuple[int,int]) -> int:
+    return pos[1]*COLS + pos[0]
+
+def unpack(i: int) -> Tuple[int,int]:
+    return (i % COLS, i // COLS)
+
 
 # ─────────────────────────────────────────────
 # A* SEARCH
@@ -62,82 +97,332 @@ def opposite(d):
 # h(n) = Manhattan distance heuristic to goal
 # The heuristic is admissible: never overestimates
 # (each cell costs 1, Manhattan ≤ actual path).
+# astar reads h from a per-search table rather than
+# recomputing it for every neighbour.
 
-def heuristic(a: Tuple[int,int], b: Tuple[int,int]) -> int:
-    """Manhattan distance — admissible & consistent heuristic."""
-    return abs(a[0]-b[0]) + abs(a[1]-b[1])
+# While the largest distance, COLS+ROWS-2, fits in a byte the table is
+# bytes: _SHIFT[k] adds k to every byte via bytes.translate, so each row
+# is produced by one C-level call. Larger boards use array('H') instead.
+_BYTE_TABLES = COLS + ROWS - 2 <= 255
+_SHIFT = [bytes(min(v + k, 255) for v in range(256)) for k in range(ROWS)] \
+         if _BYTE_TABLES else []
 
+def heuristic_table(goal: Tuple[int,int]):
+    """
+    h for every cell, indexed as y*COLS + x: Manhattan distance to goal.
+    Returns bytes or array('H').
+    """
+    gx, gy = goal
+    row = [abs(x-gx) for x in range(COLS)]
+    if _BYTE_TABLES:
+        row = bytes(row)
+        return b"".join([row.translate(_SHIFT[abs(y-gy)]) for y in range(ROWS)])
+
+    table = array("H")
+    for y in range(ROWS):
+        table.extend(map(abs(y-gy).__add__, row))
+    return table
+
+# astar is generated at import: the template below is filled in with the
+# board size as literals and the four neighbour checks (UP, DOWN, LEFT,
+# RIGHT) as straight-line code, then compiled once. The result has no
+# direction loop, no tuple unpacking and no COLS/ROWS lookups.
+_ASTAR_SRC = Template('''
 def astar(start: Tuple[int,int],
           goal:  Tuple[int,int],
-          blocked: set) -> Optional[List[Tuple[int,int]]]:
+          blocked: bytearray) -> Optional[List[Tuple[int,int]]]:
     """
     A* Search on a 2-D grid.
+    `blocked` is a COLS*ROWS bitmap indexed as y*COLS + x.
     Returns the shortest path (list of cells) from start to goal,
     or None if no path exists.
     """
-    # Priority queue: (f, g, node, path)
+    # Bind hot names to locals – global lookups dominate the inner loop
+    push, pop, pushpop = heapq.heappush, heapq.heappop, heapq.heappushpop
+    h = heuristic_table(goal)
+
+    # Nodes are packed cell indices (y*COLS + x): int keys hash to
+    # themselves and neighbours are plain additions, no tuple allocs.
+    start_i = pack(start)
+    goal_i  = pack(goal)
+
+    # Priority queue: (f, -g, node) – on equal f the deeper node pops first,
+    # so plateaus are followed straight through instead of fanned out.
+    # The path is rebuilt from came_from, a flat back-pointer array
+    # indexed by node (-1 = no parent). `entry` is the node being
+    # expanded; it is taken off the heap before the loop body runs.
     open_list = []
-    heapq.heappush(open_list, (heuristic(start, goal), 0, start, [start]))
-    closed = set()
-
-    while open_list:
-        f, g, current, path = heapq.heappop(open_list)
-
-        if current == goal:
+    entry = (h[start_i], 0, start_i)
+    came_from = [-1] * $cells
+    g_score = {start_i: 0}
+    g_get = g_score.get
+
+    while True:
+        f, neg_g, i = entry
+        g = -neg_g
+
+        if i == goal_i:
+            path = [unpack(i)]
+            while i != start_i:
+                i = came_from[i]
+                path.append(unpack(i))
+            path.reverse()
             return path
 
-        if current in closed:
+        # Stale entry: a cheaper route to this node was found after the push
+        if g > g_score[i]:
+            if not open_list:
+                return None   # no path found
+            entry = pop(open_list)
             continue
-        closed.add(current)
 
-        for dx, dy in DIRS:
-            nx, ny = current[0]+dx, current[1]+dy
-            neighbor = (nx, ny)
-            if neighbor in closed:
-                continue
-            if nx < 0 or ny < 0 or nx >= COLS or ny >= ROWS:
-                continue
-            if neighbor in blocked:
-                continue
+        g_next = g + 1
+        x = i % $cols
+        best = None   # smallest new entry, held back from the heap
+$neighbours
+
+        # On an f plateau the best new entry usually beats the heap top;
+        # heappushpop then hands it straight back without a push + pop
+        if best is not None:
+            entry = pushpop(open_list, best)
+        elif open_list:
+            entry = pop(open_list)
+        else:
+            return None   # no path found
+''')
+
+_NEIGHBOUR_SRC = Template('''
+        if $guard and not blocked[i$offset]:
+            n = i$offset
+            if g_next < g_get(n, INF):
+                g_score[n] = g_next
+                came_from[n] = i
+                item = (g_next + h[n], -g_next, n)
+                if best is None:
+                    best = item
+                elif item < best:
+                    push(open_list, best)
+                    best = item
+                else:
+                    push(open_list, item)''')
+
+def _build_astar():
+    neighbours = [
+        ("i >= %d" % COLS,              "-%d" % COLS),   # UP
+        ("i < %d" % (COLS*(ROWS-1)),    "+%d" % COLS),   # DOWN
+        ("x > 0",                       "-1"),           # LEFT
+        ("x < %d" % (COLS-1),           "+1"),           # RIGHT
+    ]
+    src = _ASTAR_SRC.substitute(
+        cols=COLS, cells=COLS*ROWS,
+        neighbours="".join(_NEIGHBOUR_SRC.substitute(guard=g, offset=o)
+                           for g, o in neighbours))
+    namespace: Dict[str, object] = {}
+    exec(compile(src, "<generated astar>", "exec"), globals(), namespace)
+    return namespace["astar"]
+
+astar = _build_astar()
 
-            g_next = g + 1
-            f_next = g_next + heuristic(neighbor, goal)
-            heapq.heappush(open_list, (f_next, g_next, neighbor, path + [neighbor]))
 
-    return None   # no path found
+# ─────────────────────────────────────────────
+# FLOOD FILL (survival heuristic)
+# ─────────────────────────────────────────────
+def flood_fill_count(start: Tuple[int,int], blocked: bytearray,
+                     cap: Optional[int] = None) -> int:
+    """BFS flood fill – counts reachable cells from start, stopping at `cap`."""
+    cols = COLS
+    last_row = COLS * (ROWS - 1)
+    if cap is None:
+        cap = COLS * ROWS
+    # Visited cells are marked in a private copy of the bitmap
+    seen  = bytearray(blocked)
+    i     = pack(start)
+    seen[i] = 1
+    count = 1
+    queue = deque([i])
+    push, pop = queue.append, queue.popleft
+    while queue and count < cap:
+        i = pop()
+        x = i % cols
+        if i >= cols and not seen[i-cols]:
+            seen[i-cols] = 1; count += 1; push(i-cols)
+        if i < last_row and not seen[i+cols]:
+            seen[i+cols] = 1; count += 1; push(i+cols)
+        if x > 0 and not seen[i-1]:
+            seen[i-1] = 1; count += 1; push(i-1)
+        if x < cols-1 and not seen[i+1]:
+            seen[i+1] = 1; count += 1; push(i+1)
+    return min(count, cap)
 
 
 # ─────────────────────────────────────────────
-# FLOOD FILL (survival heuristic)
+# NUMBA KERNELS (optional)
 # ─────────────────────────────────────────────
-def flood_fill_count(start: Tuple[int,int], blocked: set) -> int:
-    """BFS flood fill – counts reachable cells from start."""
-    visited = {start}
-    queue   = [start]
-    while queue:
-        x, y = queue.pop()
-        for dx, dy in DIRS:
-            nx, ny = x+dx, y+dy
-            n = (nx, ny)
-            if n not in visited and n not in blocked \
-               and 0 <= nx < COLS and 0 <= ny < ROWS:
-                visited.add(n)
-                queue.append(n)
-    return len(visited)
+# Same algorithms on a (ROWS, COLS) uint8 view of the blocked bitmap.
+# Numba has no heapq, so the open list is a binary heap kept in three
+# parallel int32 arrays (f, g, packed y*cols + x). Signatures are given
+# so compilation happens once at import and is cached to disk.
+
+@njit(cache=True)
+def _heap_less(hf, hg, hk, i, j):
+    if hf[i] != hf[j]:
+        return hf[i] < hf[j]
+    if hg[i] != hg[j]:
+        return hg[i] > hg[j]          # deeper node first on f ties
+    return hk[i] < hk[j]
+
+@njit(cache=True)
+def _heap_swap(hf, hg, hk, i, j):
+    hf[i], hf[j] = hf[j], hf[i]
+    hg[i], hg[j] = hg[j], hg[i]
+    hk[i], hk[j] = hk[j], hk[i]
+
+@njit(cache=True)
+def _heap_push(hf, hg, hk, size, f, g, k):
+    hf[size], hg[size], hk[size] = f, g, k
+    i = size
+    while i > 0:
+        parent = (i - 1) >> 1
+        if not _heap_less(hf, hg, hk, i, parent):
+            break
+        _heap_swap(hf, hg, hk, i, parent)
+        i = parent
+    return size + 1
+
+@njit(cache=True)
+def _heap_pop(hf, hg, hk, size):
+    """Drop the root; the caller reads hf[0], hg[0], hk[0] beforehand."""
+    size -= 1
+    hf[0], hg[0], hk[0] = hf[size], hg[size], hk[size]
+    i = 0
+    while True:
+        child = 2*i + 1
+        if child >= size:
+            break
+        if child + 1 < size and _heap_less(hf, hg, hk, child + 1, child):
+            child += 1
+        if not _heap_less(hf, hg, hk, child, i):
+            break
+        _heap_swap(hf, hg, hk, i, child)
+        i = child
+    return size
+
+@njit("int32(int32, int32, int32, int32, uint8[:, :], int32[:, :])", cache=True)
+def _astar_kernel(sx, sy, gx, gy, blocked, path):
+    """Writes the path into `path` and returns its length (-1 if none)."""
+    rows, cols = blocked.shape
+    n = rows * cols
+    cap = 4*n + 1                      # a cell is pushed at most once per neighbour
+    hf = np.empty(cap, np.int32)
+    hg = np.empty(cap, np.int32)
+    hk = np.empty(cap, np.int32)
+    g_score   = np.full(n, n + 1, np.int32)
+    came_from = np.full(n, -1, np.int32)
+
+    start = sy*cols + sx
+    goal  = gy*cols + gx
+    g_score[start] = 0
+    size = _heap_push(hf, hg, hk, 0, abs(sx-gx) + abs(sy-gy), 0, start)
+
+    while size > 0:
+        g, cur = hg[0], hk[0]
+        size = _heap_pop(hf, hg, hk, size)
+
+        if cur == goal:
+            for k in range(g, -1, -1):
+                path[k, 0] = cur % cols
+                path[k, 1] = cur // cols
+                cur = came_from[cur]
+            return g + 1
+
+        if g > g_score[cur]:
+            continue
+
+        x, y = cur % cols, cur // cols
+        g_next = g + 1
+        for d in range(4):
+            nx, ny = x, y
+            if d == 0:
+                ny -= 1
+            elif d == 1:
+                ny += 1
+            elif d == 2:
+                nx -= 1
+            else:
+                nx += 1
+            if nx < 0 or ny < 0 or nx >= cols or ny >= rows or blocked[ny, nx]:
+                continue
+            nb = ny*cols + nx
+            if g_next >= g_score[nb]:
+                continue
+            g_score[nb]   = g_next
+            came_from[nb] = cur
+            size = _heap_push(hf, hg, hk, size,
+                              g_next + abs(nx-gx) + abs(ny-gy), g_next, nb)
+    return -1
+
+@njit("int32(int32, int32, uint8[:, :], int32)", cache=True)
+def _flood_fill_kernel(sx, sy, blocked, cap):
+    rows, cols = blocked.shape
+    seen  = blocked.ravel().copy()
+    queue = np.empty(rows * cols, np.int32)
+    start = sy*cols + sx
+    seen[start] = 1
+    queue[0] = start
+    head, tail = 0, 1
+    while head < tail and tail < cap:
+        i = queue[head]
+        head += 1
+        x = i % cols
+        if i >= cols and not seen[i-cols]:
+            seen[i-cols] = 1; queue[tail] = i-cols; tail += 1
+        if i < (rows-1)*cols and not seen[i+cols]:
+            seen[i+cols] = 1; queue[tail] = i+cols; tail += 1
+        if x > 0 and not seen[i-1]:
+            seen[i-1] = 1; queue[tail] = i-1; tail += 1
+        if x < cols-1 and not seen[i+1]:
+            seen[i+1] = 1; queue[tail] = i+1; tail += 1
+    return min(tail, cap)
+
+if HAVE_NUMBA:
+    _PATH_BUF = np.empty((COLS * ROWS, 2), np.int32)
+
+    def _as_grid(blocked: bytearray):
+        """Zero-copy (ROWS, COLS) view of the blocked bitmap."""
+        return np.frombuffer(blocked, dtype=np.uint8).reshape(ROWS, COLS)
+
+    def _astar_numba(start: Tuple[int,int],
+                     goal:  Tuple[int,int],
+                     blocked: bytearray) -> Optional[List[Tuple[int,int]]]:
+        length = _astar_kernel(start[0], start[1], goal[0], goal[1],
+                               _as_grid(blocked), _PATH_BUF)
+        if length < 0:
+            return None
+        return [tuple(c) for c in _PATH_BUF[:length].tolist()]
+
+    def _flood_fill_count_numba(start: Tuple[int,int], blocked: bytearray,
+                                cap: Optional[int] = None) -> int:
+        if cap is None:
+            cap = COLS * ROWS
+        return int(_flood_fill_kernel(start[0], start[1], _as_grid(blocked), cap))
+
+    astar, flood_fill_count = _astar_numba, _flood_fill_count_numba
 
 
 # ─────────────────────────────────────────────
 # CYCLE (player / enemy)
 # ─────────────────────────────────────────────
-@dataclass
+@dataclass(slots=True)
 class Cycle:
     pos:        Tuple[int,int]
     direction:  Tuple[int,int]
-    trail:      set = field(default_factory=set)
+    trail:      set = field(default_factory=set)   # packed cell indices
     alive:      bool = True
+    idx:        int = field(init=False)             # pack(pos)
 
     def __post_init__(self):
-        self.trail.add(self.pos)
+        self.idx = pack(self.pos)
+        self.trail.add(self.idx)
 
     def next_pos(self, d=None) -> Tuple[int,int]:
         d = d or self.direction
@@ -146,7 +431,8 @@ class Cycle:
     def move(self):
         nxt = self.next_pos()
         self.pos = nxt
-        self.trail.add(nxt)
+        self.idx = pack(nxt)
+        self.trail.add(self.idx)
 
     def in_bounds(self, pos=None) -> bool:
         x, y = pos or self.pos
@@ -165,6 +451,8 @@ class EnemyAgent:
     Fallback: if intercepting is blocked, use flood-fill
     survival strategy (pick direction with most open space).
     """
+    __slots__ = ("enemy", "player", "plan", "ticks", "grid")
+
     REPLAN_INTERVAL = 3   # replan every N game ticks
 
     def __init__(self, enemy: Cycle, player: Cycle):
@@ -172,9 +460,16 @@ class EnemyAgent:
         self.player = player
         self.plan:  List[Tuple[int,int]] = []
         self.ticks  = 0
+        # Bitmap of every trail cell, indexed as y*COLS + x.
+        # Kept current by mark() instead of being rebuilt each tick.
+        self.grid   = bytearray(COLS * ROWS)
+        for trail in (enemy.trail, player.trail):
+            for i in trail:
+                self.mark(i)
 
-    def _blocked(self) -> set:
-        return self.enemy.trail | self.player.trail
+    def mark(self, i: int):
+        """Record a newly laid trail cell (packed index)."""
+        self.grid[i] = 1
 
     def _predict_player(self, steps=4) -> Tuple[int,int]:
         """Predict where player will be in `steps` moves (straight-line)."""
@@ -189,19 +484,18 @@ class EnemyAgent:
     def decide(self) -> Tuple[int,int]:
         """
         Agentic decision:
-        1. Try A* to intercept predicted player position
-        2. Fallback: A* to current player position
-        3. Fallback: flood-fill survival (pick most open direction)
+        1. A* to intercept predicted player position
+        2. Fallback: flood-fill survival (pick most open direction)
+        (The player's current cell is never a usable goal: it is
+        already part of the trail, so A* can't enter it.)
         """
         self.ticks += 1
-        blocked = self._blocked()
+        blocked = self.grid
 
         # Re-plan on interval or if plan exhausted
         if self.ticks % self.REPLAN_INTERVAL == 0 or not self.plan:
             goal = self._predict_player(steps=5)
             path = astar(self.enemy.pos, goal, blocked)
-            if path is None:
-                path = astar(self.enemy.pos, self.player.pos, blocked)
             if path and len(path) > 1:
                 self.plan = path[1:]   # skip current position
             else:
@@ -215,16 +509,18 @@ class EnemyAgent:
             chosen = (dx, dy)
             # Safety check: don't walk into a wall
             nx, ny = self.enemy.next_pos(chosen)
-            if (nx, ny) not in blocked and self.enemy.in_bounds((nx, ny)):
+            if self.enemy.in_bounds((nx, ny)) and not blocked[pack((nx, ny))]:
                 return chosen
 
         # Flood-fill survival fallback
         return self._survival_direction(blocked)
 
-    def _survival_direction(self, blocked: set) -> Tuple[int,int]:
+    def _survival_direction(self, blocked: bytearray) -> Tuple[int,int]:
         """Choose direction that maximises reachable open space."""
         best_dir   = self.enemy.direction
         best_space = -1
+        best_cell  = None
+        exact      = True
         opp = opposite(self.enemy.direction)
 
         for d in DIRS:
@@ -233,12 +529,25 @@ class EnemyAgent:
             nx, ny = self.enemy.next_pos(d)
             if not (0 <= nx < COLS and 0 <= ny < ROWS):
                 continue
-            if (nx, ny) in blocked:
+            if blocked[pack((nx, ny))]:
                 continue
-            space = flood_fill_count((nx, ny), blocked | {(nx, ny)})
+            if best_space < 0:
+                space = flood_fill_count((nx, ny), blocked)
+                cap   = None
+            else:
+                # Only "more than best" matters, so stop counting there. A
+                # capped winner is recounted only if another candidate
+                # still needs its exact size as a cap.
+                if not exact:
+                    best_space = flood_fill_count(best_cell, blocked)
+                    exact = True
+                cap   = best_space + 1
+                space = flood_fill_count((nx, ny), blocked, cap)
             if space > best_space:
                 best_space = space
                 best_dir   = d
+                best_cell  = (nx, ny)
+                exact      = cap is None or space < cap
 
         return best_dir
 
@@ -246,15 +555,22 @@ class EnemyAgent:
 # ─────────────────────────────────────────────
 # GLOW DRAWING HELPER
 # ─────────────────────────────────────────────
+# Glow sprites depend only on (color, cell, glow_r): render each once
+_GLOW_CACHE: Dict[tuple, pygame.Surface] = {}
+
 def draw_glow_cell(surface, color, x, y, cell, glow_r=3):
     cx, cy = x*cell + cell//2, y*cell + cell//2
     # Soft outer glow
-    glow_surf = pygame.Surface((cell*4, cell*4), pygame.SRCALPHA)
-    alpha = 40
-    for r in range(glow_r, 0, -1):
-        pygame.draw.circle(glow_surf, (*color, alpha),
-                           (cell*2, cell*2), cell//2 + r*3)
-        alpha += 20
+    key = (color, cell, glow_r)
+    glow_surf = _GLOW_CACHE.get(key)
+    if glow_surf is None:
+        glow_surf = pygame.Surface((cell*4, cell*4), pygame.SRCALPHA)
+        alpha = 40
+        for r in range(glow_r, 0, -1):
+            pygame.draw.circle(glow_surf, (*color, alpha),
+                               (cell*2, cell*2), cell//2 + r*3)
+            alpha += 20
+        glow_surf = _GLOW_CACHE[key] = glow_surf.convert_alpha()
     surface.blit(glow_surf, (cx - cell*2, cy - cell*2))
     # Core
     pygame.draw.rect(surface, color, (x*cell+1, y*cell+1, cell-2, cell-2))
@@ -271,7 +587,13 @@ class TronGame:
         pygame.init()
         pygame.display.set_caption("TRON  ·  Light Cycle  ·  A* AI")
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        # Static background: filled and gridded once, blitted every frame
+        self.grid_surface = pygame.Surface((WIDTH, HEIGHT))
+        self.grid_surface.fill(BG_COLOR)
+        self.draw_grid(self.grid_surface)
+        self.grid_surface = self.grid_surface.convert()
         self.clock  = pygame.time.Clock()
+        self.acc    = 0.0     # ms of simulation time not yet stepped
         self.font_big   = pygame.font.SysFont("Courier New", 48, bold=True)
         self.font_small = pygame.font.SysFont("Courier New", 22, bold=True)
         self.font_tiny  = pygame.font.SysFont("Courier New", 14)
@@ -283,37 +605,44 @@ class TronGame:
         # Enemy starts right-center heading left
         self.enemy  = Cycle(pos=(COLS-10, ROWS//2), direction=LEFT)
         self.agent  = EnemyAgent(self.enemy, self.player)
+        # Steering keys not yet applied, one consumed per tick, so quick
+        # turns (e.g. UP then LEFT within one tick) both take effect
+        self.pending_dirs: deque = deque(maxlen=3)
+        # Trails only ever grow: paint each new cell once onto a copy of
+        # the grid and blit that single opaque layer every frame
+        self.trail_surface = self.grid_surface.copy()
+        self.paint_trail(self.player, PLAYER_TRAIL)
+        self.paint_trail(self.enemy,  ENEMY_TRAIL)
         self.state  = "playing"   # "playing" | "win" | "lose"
         self.score  = 0
         self.frame  = 0
 
-    def handle_input(self):
-        keys = pygame.key.get_pressed()
-        d = self.player.direction
-        if (keys[pygame.K_UP]    or keys[pygame.K_w]) and d != DOWN:
-            self.player.direction = UP
-        elif (keys[pygame.K_DOWN]  or keys[pygame.K_s]) and d != UP:
-            self.player.direction = DOWN
-        elif (keys[pygame.K_LEFT]  or keys[pygame.K_a]) and d != RIGHT:
-            self.player.direction = LEFT
-        elif (keys[pygame.K_RIGHT] or keys[pygame.K_d]) and d != LEFT:
-            self.player.direction = RIGHT
+    def queue_turn(self, d: Tuple[int,int]):
+        """Buffer a steering key, checked against the last queued direction."""
+        q = self.pending_dirs
+        last = q[-1] if q else self.player.direction
+        if len(q) < q.maxlen and d != last and d != opposite(last):
+            q.append(d)
 
     def update(self):
         if self.state != "playing":
             return
 
+        # Player input, buffered from KEYDOWN events in run()
+        if self.pending_dirs:
+            self.player.direction = self.pending_dirs.popleft()
+
         # AI decision (agentic loop)
         new_dir = self.agent.decide()
         self.enemy.direction = new_dir
 
         # Move
-        blocked = self.player.trail | self.enemy.trail
+        blocked = self.agent.grid
         p_nxt = self.player.next_pos()
         e_nxt = self.enemy.next_pos()
 
-        p_crash = (not self.player.in_bounds(p_nxt)) or (p_nxt in blocked)
-        e_crash = (not self.enemy.in_bounds(e_nxt))  or (e_nxt in blocked)
+        p_crash = (not self.player.in_bounds(p_nxt)) or blocked[pack(p_nxt)]
+        e_crash = (not self.enemy.in_bounds(e_nxt))  or blocked[pack(e_nxt)]
         head_on = (p_nxt == e_nxt)
 
         if p_crash and e_crash:
@@ -326,24 +655,24 @@ class TronGame:
         else:
             self.player.move()
             self.enemy.move()
+            self.agent.mark(self.player.idx)
+            self.agent.mark(self.enemy.idx)
+            self.paint_trail(self.player, PLAYER_TRAIL)
+            self.paint_trail(self.enemy,  ENEMY_TRAIL)
             self.frame += 1
 
-    def draw_grid(self):
+    def draw_grid(self, surface):
         for x in range(0, WIDTH, CELL):
-            pygame.draw.line(self.screen, GRID_COLOR, (x, 0), (x, HEIGHT))
+            pygame.draw.line(surface, GRID_COLOR, (x, 0), (x, HEIGHT))
         for y in range(0, HEIGHT, CELL):
-            pygame.draw.line(self.screen, GRID_COLOR, (0, y), (WIDTH, y))
+            pygame.draw.line(surface, GRID_COLOR, (0, y), (WIDTH, y))
+
+    def paint_trail(self, cycle: Cycle, color):
+        """Add the cycle's current cell to the persistent trail layer."""
+        draw_trail_cell(self.trail_surface, color, *cycle.pos, CELL)
 
     def draw_cycles(self):
-        # Player trail
-        for (x, y) in self.player.trail:
-            if (x, y) != self.player.pos:
-                draw_trail_cell(self.screen, PLAYER_TRAIL, x, y, CELL)
-        # Enemy trail
-        for (x, y) in self.enemy.trail:
-            if (x, y) != self.enemy.pos:
-                draw_trail_cell(self.screen, ENEMY_TRAIL, x, y, CELL)
-        # Cycle heads
+        # Cycle heads (trails live on trail_surface, blitted in run)
         draw_glow_cell(self.screen, PLAYER_COLOR, *self.player.pos, CELL)
         draw_glow_cell(self.screen, ENEMY_COLOR,  *self.enemy.pos,  CELL)
 
@@ -394,17 +723,21 @@ class TronGame:
                         pygame.quit(); sys.exit()
                     if event.key == pygame.K_r:
                         self.reset()
+                    elif event.key in KEY_DIRS:
+                        self.queue_turn(KEY_DIRS[event.key])
 
-            self.handle_input()
-            self.update()
+            # Fixed-timestep simulation, decoupled from the render rate.
+            # The backlog is clamped so a stall can't trigger a burst of ticks.
+            self.acc = min(self.acc + self.clock.tick(RENDER_FPS), 5 * TICK_MS)
+            while self.acc >= TICK_MS:
+                self.update()
+                self.acc -= TICK_MS
 
-            self.screen.fill(BG_COLOR)
-            self.draw_grid()
+            self.screen.blit(self.trail_surface, (0, 0))   # grid + trails
             self.draw_cycles()
             self.draw_hud()
             self.draw_overlay()
             pygame.display.flip()
-            self.clock.tick(FPS)
 
 
 if __name__ == "__main__":